@@ -124,7 +124,9 @@ class H5Reader:
             indices = None
 
             try:
-                indices = h5file[name]["Objects"][cls.uuid_str(uid)]["Cells"][:]
+                indices = cls.read_dataset(
+                    h5file[name]["Objects"][cls.uuid_str(uid)]["Cells"]
+                )
             except KeyError:
                 pass
 
@@ -188,23 +190,23 @@ class H5Reader:
             name = list(h5file.keys())[0]
 
             try:
-                u_delimiters = np.r_[
+                u_delimiters = cls.read_dataset(
                     h5file[name]["Objects"][cls.uuid_str(uid)]["U cell delimiters"]
-                ]
+                )
             except KeyError:
                 u_delimiters = None
 
             try:
-                v_delimiters = np.r_[
+                v_delimiters = cls.read_dataset(
                     h5file[name]["Objects"][cls.uuid_str(uid)]["V cell delimiters"]
-                ]
+                )
             except KeyError:
                 v_delimiters = None
 
             try:
-                z_delimiters = np.r_[
+                z_delimiters = cls.read_dataset(
                     h5file[name]["Objects"][cls.uuid_str(uid)]["Z cell delimiters"]
-                ]
+                )
             except KeyError:
                 z_delimiters = None
 
@@ -248,9 +250,9 @@ class H5Reader:
             name = list(h5file.keys())[0]
 
             try:
-                octree_cells = np.r_[
+                octree_cells = cls.read_dataset(
                     h5file[name]["Objects"][cls.uuid_str(uid)]["Octree Cells"]
-                ]
+                )
             except KeyError:
                 octree_cells = None
 
@@ -371,7 +373,10 @@ class H5Reader:
             name = list(h5file.keys())[0]
 
             try:
-                values = np.r_[h5file[name]["Data"][cls.uuid_str(uid)]["Data"]]
+                # Scalar datasets from other writers are promoted to 1-D
+                values = np.atleast_1d(
+                    cls.read_dataset(h5file[name]["Data"][cls.uuid_str(uid)]["Data"])
+                )
                 if isinstance(values[0], (str, bytes)):
                     values = cls.str_from_utf8_bytes(values[0])
                 else:
@@ -405,7 +410,7 @@ class H5Reader:
             root = list(h5file.keys())[0]
 
             try:
-                coordinates = np.asarray(
+                coordinates = cls.read_dataset(
                     h5file[root]["Objects"][cls.uuid_str(uid)][cls.key_map[name]]
                 )
             except KeyError:
@@ -434,6 +439,20 @@ class H5Reader:
 
         return trace_depth
 
+    @staticmethod
+    def read_dataset(dataset: h5py.Dataset) -> np.ndarray:
+        """
+        Read a full dataset directly into a pre-allocated array.
+
+        :param dataset: :obj:`h5py.Dataset` to be read.
+
+        :return values: :obj:`numpy.ndarray` of the dataset shape and dtype.
+        """
+        values = np.empty(dataset.shape, dtype=dataset.dtype)
+        dataset.read_direct(values)
+
+        return values
+
     @staticmethod
     def bool_value(value: np.int8) -> bool:
         return bool(value)
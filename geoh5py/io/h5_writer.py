@@ -99,10 +99,34 @@ class H5Writer:
             label,
             data=dataset,
             dtype=dataset.dtype,
+            chunks=cls.chunk_shape(dataset),
             compression="gzip",
             compression_opts=9,
         )
 
+    @staticmethod
+    def chunk_shape(values: np.ndarray, target_bytes: int = 2 ** 20) -> tuple | None:
+        """
+        Chunk shape spanning complete rows of an array, sized to about
+        ``target_bytes`` so that full reads only touch a few chunks.
+
+        :param values: Array of values to be written.
+        :param target_bytes: Targeted size of a chunk, in bytes.
+
+        :return chunks: Shape of the chunks, or None to let h5py guess for
+            empty arrays.
+
+        Larger chunks compress better and need fewer lookups on full reads,
+        but any partial read decompresses at least one whole chunk.
+        """
+        if values.ndim == 0 or values.shape[0] == 0:
+            return None
+
+        row_bytes = values.dtype.itemsize * int(np.prod(values.shape[1:]))
+        n_rows = max(1, target_bytes // max(row_bytes, 1))
+
+        return (min(values.shape[0], n_rows),) + values.shape[1:]
+
     @staticmethod
     def remove_child(
         file: str | h5py.File,
@@ -342,6 +366,11 @@ class H5Writer:
                 if key in ["Association", "Primitive type"]:
                     value = value.name.lower().capitalize()
 
+                if key == "Collar" and value is not None:
+                    value = np.asarray(
+                        tuple(value), dtype=[("x", float), ("y", float), ("z", float)]
+                    )
+
                 if isinstance(value, (np.int8, bool)):
                     entity_handle.attrs.create(key, int(value), dtype="int8")
                 elif isinstance(value, str):
@@ -494,9 +523,12 @@ class H5Writer:
             entity_handle = H5Writer.fetch_handle(h5file, entity)
 
             if getattr(entity, attribute, None) is not None:
+                values = getattr(entity, "_" + attribute)
                 entity_handle.create_dataset(
                     cls.key_map[attribute],
-                    data=getattr(entity, "_" + attribute),
+                    data=values,
+                    chunks=cls.chunk_shape(values),
+                    shuffle=True,
                     compression="gzip",
                     compression_opts=9,
                 )
@@ -556,6 +588,8 @@ class H5Writer:
                 entity_handle.create_dataset(
                     cls.key_map[attribute],
                     data=out_values,
+                    chunks=cls.chunk_shape(out_values),
+                    shuffle=True,
                     compression="gzip",
                     compression_opts=9,
                 )
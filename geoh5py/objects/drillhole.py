@@ -15,7 +15,7 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with geoh5py.  If not, see <https://www.gnu.org/licenses/>.
 
-# pylint: disable=R0902
+# pylint: disable=R0902, R0904
 
 from __future__ import annotations
 
@@ -24,6 +24,7 @@ import uuid
 import numpy as np
 
 from ..data.data import Data
+from ..shared import Entity
 from ..shared.utils import match_values, merge_arrays
 from .object_base import ObjectType
 from .points import Points
@@ -55,12 +56,13 @@ class Drillhole(Points):
         self._cost: float | None = 0.0
         self._planning: str = "Default"
         self._surveys: np.ndarray = None
+        self._surveys_f64: np.ndarray | None = None
         self._trace: np.ndarray = None
+        self._trace_view: np.ndarray | None = None
         self._trace_depth: np.ndarray | None = None
         self._locations = None
-        self._deviation_x = None
-        self._deviation_y = None
-        self._deviation_z = None
+        self._deviations: np.ndarray | None = None
+        self._depth_data: dict[str, Data | None] = {}
         self._default_collocation_distance = 1e-2
 
         super().__init__(object_type, **kwargs)
@@ -75,7 +77,7 @@ class Drillhole(Points):
         :obj:`numpy.ndarray` of :obj:`int`, shape (\*, 2):
         Array of indices defining segments connecting vertices.
         """
-        if getattr(self, "_cells", None) is None:
+        if self._cells is None:
             if self.existing_h5_entity:
                 self._cells = self.workspace.fetch_cells(self.uid)
 
@@ -102,16 +104,20 @@ class Drillhole(Points):
 
             assert len(value) == 3, "Origin must be a list or numpy array of shape (3,)"
 
+            value = np.asarray(tuple(value), dtype=np.float64)
+
+            # Re-assigning the same collar keeps the locations and trace
+            if self._collar is not None and np.array_equal(self._collar, value):
+                return
+
             self.modified_attributes = "attributes"
-            value = np.asarray(
-                tuple(value), dtype=[("x", float), ("y", float), ("z", float)]
-            )
             self._collar = value
         self._locations = None
 
         if self.trace is not None:
             self.modified_attributes = "trace"
             self._trace = None
+            self._trace_view = None
 
     @property
     def cost(self):
@@ -130,50 +136,68 @@ class Drillhole(Points):
         """
         :obj:`numpy.ndarray`: Store the change in x-coordinates along the well path.
         """
-        if getattr(self, "_deviation_x", None) is None and self.surveys is not None:
-            lengths = self.surveys[1:, 0] - self.surveys[:-1, 0]
-            dl_in = np.cos(np.deg2rad(450.0 - self.surveys[:-1, 2] % 360.0)) * np.cos(
-                np.deg2rad(self.surveys[:-1, 1])
-            )
-            dl_out = np.cos(np.deg2rad(450.0 - self.surveys[1:, 2] % 360.0)) * np.cos(
-                np.deg2rad(self.surveys[1:, 1])
-            )
-            ddl = np.divide(dl_out - dl_in, lengths, where=lengths != 0)
-            self._deviation_x = dl_in + lengths * ddl / 2.0
+        if self._deviations is None:
+            self._compute_deviations()
+
+        if self._deviations is None:
+            return None
 
-        return self._deviation_x
+        return self._deviations[:, 0]
 
     @property
     def deviation_y(self):
         """
         :obj:`numpy.ndarray`: Store the change in y-coordinates along the well path.
         """
-        if getattr(self, "_deviation_y", None) is None and self.surveys is not None:
-            lengths = self.surveys[1:, 0] - self.surveys[:-1, 0]
-            dl_in = np.sin(np.deg2rad(450.0 - self.surveys[:-1, 2] % 360.0)) * np.cos(
-                np.deg2rad(self.surveys[:-1, 1])
-            )
-            dl_out = np.sin(np.deg2rad(450.0 - self.surveys[1:, 2] % 360.0)) * np.cos(
-                np.deg2rad(self.surveys[1:, 1])
-            )
-            ddl = np.divide(dl_out - dl_in, lengths, where=lengths != 0)
-            self._deviation_y = dl_in + lengths * ddl / 2.0
+        if self._deviations is None:
+            self._compute_deviations()
+
+        if self._deviations is None:
+            return None
 
-        return self._deviation_y
+        return self._deviations[:, 1]
 
     @property
     def deviation_z(self):
         """
         :obj:`numpy.ndarray`: Store the change in z-coordinates along the well path.
         """
-        if getattr(self, "_deviation_z", None) is None and self.surveys is not None:
-            lengths = self.surveys[1:, 0] - self.surveys[:-1, 0]
-            dl_in = np.sin(np.deg2rad(self.surveys[:-1, 1]))
-            dl_out = np.sin(np.deg2rad(self.surveys[1:, 1]))
-            ddl = np.divide(dl_out - dl_in, lengths, where=lengths != 0)
-            self._deviation_z = dl_in + lengths * ddl / 2.0
-
-        return self._deviation_z
+        if self._deviations is None:
+            self._compute_deviations()
+
+        if self._deviations is None:
+            return None
+
+        return self._deviations[:, 2]
+
+    def _compute_deviations(self):
+        """
+        Compute the changes in x, y and z-coordinates along the well path in a
+        single pass over the surveys.
+        """
+        surveys = self.surveys
+        if surveys is None:
+            return
+
+        lengths = (surveys[1:, 0] - surveys[:-1, 0])[:, None]
+        # Azimuth clockwise from North: cos(90 - az) = sin(az), sin(90 - az) = cos(az)
+        az_rad = np.deg2rad(surveys[:, 2])
+        dip_rad = np.deg2rad(surveys[:, 1])
+        cos_dip = np.cos(dip_rad)
+        unit_vectors = np.c_[
+            np.sin(az_rad) * cos_dip,
+            np.cos(az_rad) * cos_dip,
+            np.sin(dip_rad),
+        ]
+        dl_in = unit_vectors[:-1, :]
+        dl_out = unit_vectors[1:, :]
+        ddl = np.divide(
+            dl_out - dl_in,
+            lengths,
+            out=np.zeros_like(dl_in),
+            where=lengths != 0,
+        )
+        self._deviations = dl_in + lengths * ddl / 2.0
 
     @property
     def locations(self):
@@ -181,16 +205,20 @@ class Drillhole(Points):
         :obj:`numpy.ndarray`: Lookup array of the well path x,y,z coordinates.
         """
         if (
-            getattr(self, "_locations", None) is None
+            self._locations is None
             and self.collar is not None
             and self.surveys is not None
         ):
             lengths = self.surveys[1:, 0] - self.surveys[:-1, 0]
-            self._locations = np.c_[
-                self.collar["x"] + np.cumsum(np.r_[0.0, lengths * self.deviation_x]),
-                self.collar["y"] + np.cumsum(np.r_[0.0, lengths * self.deviation_y]),
-                self.collar["z"] + np.cumsum(np.r_[0.0, lengths * self.deviation_z]),
-            ]
+            if self._deviations is None:
+                self._compute_deviations()
+
+            steps = self._deviations * lengths[:, None]
+            locations = np.empty((steps.shape[0] + 1, 3))
+            locations[0, :] = 0.0
+            np.cumsum(steps, axis=0, out=locations[1:, :])
+            locations += self.collar
+            self._locations = locations
 
         return self._locations
 
@@ -212,19 +240,21 @@ class Drillhole(Points):
         """
         :obj:`numpy.array` of :obj:`float`, shape (3, ): Coordinates of the surveys
         """
-        if (getattr(self, "_surveys", None) is None) and self.existing_h5_entity:
+        if self._surveys is None and self.existing_h5_entity:
             self._surveys = self.workspace.fetch_coordinates(self.uid, "surveys")
 
-        if getattr(self, "_surveys", None) is not None:
+        if self._surveys_f64 is None and self._surveys is not None:
             surveys = self._surveys.view("<f4").reshape((-1, 3))
 
             # Repeat first survey point at surface for de-survey interpolation
-            surveys = np.vstack([surveys[0, :], surveys])
-            surveys[0, 0] = 0.0
+            self._surveys_f64 = np.empty((surveys.shape[0] + 1, 3), dtype=np.float64)
+            self._surveys_f64[0, 0] = 0.0
+            self._surveys_f64[0, 1:] = surveys[0, 1:]
+            self._surveys_f64[1:, :] = surveys
+            # Cached and shared with the deviations, so read-only
+            self._surveys_f64.flags.writeable = False
 
-            return surveys.astype(float)
-
-        return None
+        return self._surveys_f64
 
     @surveys.setter
     def surveys(self, value):
@@ -235,16 +265,19 @@ class Drillhole(Points):
                 raise ValueError("'surveys' requires an ndarray of shape (*, 3)")
 
             self.modified_attributes = "surveys"
-            self._surveys = np.asarray(
-                np.core.records.fromarrays(
-                    value.T, names="Depth, Dip, Azimuth", formats="<f4, <f4, <f4"
-                )
+            surveys = np.empty(
+                value.shape[0],
+                dtype=[("Depth", "<f4"), ("Dip", "<f4"), ("Azimuth", "<f4")],
             )
+            for ind, name in enumerate(surveys.dtype.names):
+                surveys[name] = value[:, ind]
+
+            self._surveys = surveys
             self.modified_attributes = "trace"
             self._trace = None
-        self._deviation_x = None
-        self._deviation_y = None
-        self._deviation_z = None
+            self._trace_view = None
+        self._surveys_f64 = None
+        self._deviations = None
         self._locations = None
 
     @property
@@ -264,45 +297,66 @@ class Drillhole(Points):
         """
         :obj:`numpy.array`: Drillhole trace defining the path in 3D
         """
-        if (getattr(self, "_trace", None) is None) and self.existing_h5_entity:
+        if self._trace is None and self.existing_h5_entity:
             self._trace = self.workspace.fetch_coordinates(self.uid, "trace")
 
-        if getattr(self, "_trace", None) is not None:
-            return self._trace.view("<f8").reshape((-1, 3))
+        if self._trace_view is None and self._trace is not None:
+            self._trace_view = self._trace.view("<f8").reshape((-1, 3))
 
-        return None
+        return self._trace_view
 
     @property
     def trace_depth(self) -> np.ndarray | None:
         """
         :obj:`numpy.array`: Drillhole trace depth from top to bottom
         """
-        if getattr(self, "_trace_depth", None) is None and self.trace is not None:
-            trace = self.trace
-            self._trace_depth = trace[0, 2] - trace[:, 2]
+        if self._trace_depth is None and self.trace is not None:
+            self._trace_depth = self._trace_view[0, 2] - self._trace_view[:, 2]
 
         return self._trace_depth
 
     @property
     def _from(self):
-        data_obj = self.get_data("FROM")
-        if data_obj:
-            return data_obj[0]
-        return None
+        return self._get_depth_data("FROM")
 
     @property
     def _to(self):
-        data_obj = self.get_data("TO")
-        if data_obj:
-            return data_obj[0]
-        return None
+        return self._get_depth_data("TO")
 
     @property
     def _depth(self):
-        data_obj = self.get_data("DEPTH")
-        if data_obj:
-            return data_obj[0]
-        return None
+        return self._get_depth_data("DEPTH")
+
+    def _get_depth_data(self, name: str) -> Data | None:
+        """
+        Get the first child :obj:`~geoh5py.data.data.Data` with the given name.
+        The result is memoized until children are added or removed, or the
+        memoized entity is renamed.
+        """
+        data_obj = self._depth_data.get(name)
+        if data_obj is None or data_obj.name != name:
+            data_list = self.get_data(name)
+            data_obj = data_list[0] if data_list else None
+            self._depth_data[name] = data_obj
+
+        return data_obj
+
+    def add_children(self, children: list[Entity]):
+        """
+        :param children: Add a list of entities as
+            :obj:`~geoh5py.shared.entity.Entity.children`
+        """
+        self._depth_data = {}
+        super().add_children(children)
+
+    def remove_children(self, children: list[Entity]):
+        """
+        Remove children from the list of children entities.
+
+        :param children: List of entities
+        """
+        self._depth_data = {}
+        super().remove_children(children)
 
     def add_data(self, data: dict, property_group: str = None) -> Data | list[Data]:
         """
@@ -407,19 +461,17 @@ class Drillhole(Points):
         if isinstance(depths, list):
             depths = np.asarray(depths)
 
+        if self._deviations is None:
+            self._compute_deviations()
+
         ind_loc = np.maximum(
             np.searchsorted(self.surveys[:, 0], depths, side="left") - 1,
             0,
         )
-        ind_dev = np.minimum(ind_loc, self.deviation_x.shape[0] - 1)
+        ind_dev = np.minimum(ind_loc, self._deviations.shape[0] - 1)
         locations = (
             self.locations[ind_loc, :]
-            + (depths - self.surveys[ind_loc, 0])[:, None]
-            * np.c_[
-                self.deviation_x[ind_dev],
-                self.deviation_y[ind_dev],
-                self.deviation_z[ind_dev],
-            ]
+            + (depths - self.surveys[ind_loc, 0])[:, None] * self._deviations[ind_dev]
         )
         return locations
 
@@ -480,7 +532,9 @@ class Drillhole(Points):
                 replace="B->A",
                 mapping=indices,
             )
-            self.add_vertices(self.desurvey(np.delete(depth, indices[:, 1])))
+            new_depth = np.ones(depth.shape[0], dtype=bool)
+            new_depth[indices[:, 1]] = False
+            self.add_vertices(self.desurvey(depth[new_depth]))
             self._depth.values = depths
             self.workspace.finalize()
 
@@ -537,19 +591,14 @@ class Drillhole(Points):
                 collocation_distance=collocation_distance,
             )
 
-            # Find matching cells
-            in_match = np.ones((self._from.values.shape[0], 2)) * np.nan
-            in_match[from_ind[:, 0], 0] = from_ind[:, 1]
-            in_match[to_ind[:, 0], 1] = to_ind[:, 1]
-
-            out_match = np.ones_like(from_to) * np.nan
-            out_match[from_ind[:, 1], 0] = from_ind[:, 0]
-            out_match[to_ind[:, 1], 1] = to_ind[:, 0]
-
-            cell_map = np.c_[
-                np.where(in_match[:, 0] == in_match[:, 1])[0],
-                np.where(out_match[:, 0] == out_match[:, 1])[0],
-            ]
+            # Find matching cells: pairs of (existing, new) intervals with
+            # both the FROM and TO depths collocated
+            _, from_pairs, _ = np.intersect1d(
+                from_ind[:, 0] * from_to.shape[0] + from_ind[:, 1],
+                to_ind[:, 0] * from_to.shape[0] + to_ind[:, 1],
+                return_indices=True,
+            )
+            cell_map = from_ind[from_pairs, :]
 
             # Add vertices
             vert_new = np.ones_like(from_to, dtype="bool")
@@ -561,12 +610,14 @@ class Drillhole(Points):
             )
 
             # Add cells
-            new_cells = np.ones_like(from_to.flatten()) * np.nan
+            new_cells = np.empty(from_to.size, dtype="uint32")
             new_cells[ind_new] = self.add_vertices(self.desurvey(uni_new))[inv_map]
             new_cells = new_cells.reshape((-1, 2))
             new_cells[from_ind[:, 1], 0] = self.cells[from_ind[:, 0], 0]
             new_cells[to_ind[:, 1], 1] = self.cells[to_ind[:, 0], 1]
-            new_cells = np.delete(new_cells, cell_map[:, 1], 0)
+            cell_new = np.ones(from_to.shape[0], dtype=bool)
+            cell_new[cell_map[:, 1]] = False
+            new_cells = new_cells[cell_new, :]
 
             # Append values
             input_values = merge_arrays(
@@ -581,7 +632,7 @@ class Drillhole(Points):
             self._to.values = merge_arrays(
                 self._to.values, from_to[:, 1], mapping=cell_map
             )
-            self.cells = np.r_[self.cells, new_cells.astype("uint32")]
+            self.cells = np.r_[self.cells, new_cells]
 
         return input_values
 
@@ -589,10 +640,10 @@ class Drillhole(Points):
         """
         Read the 'DEPTH' data and sort all Data.values if needed
         """
-        if self.get_data("DEPTH"):
-            data_obj = self.get_data("DEPTH")[0]
+        if self._depth is not None:
+            data_obj = self._depth
             depths = data_obj.check_vector_length(data_obj.values)
-            if not np.all(np.diff(depths) >= 0):
+            if not np.all(depths[1:] >= depths[:-1]):
                 sort_ind = np.argsort(depths)
 
                 for child in self.children:
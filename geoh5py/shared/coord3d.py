@@ -15,6 +15,8 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with geoh5py.  If not, see <https://www.gnu.org/licenses/>.
 
+from __future__ import annotations
+
 import numpy as np
 
 
@@ -22,24 +24,38 @@ class Coord3D:
     """
     Coordinate of vertices.
 
+    The coordinates are read-only once the object is created, as contiguous
+    copies of the x, y and z columns are stored on instantiation. The input
+    array is copied and left writeable.
+
     .. warning:: Replaced by :obj:`numpy.array`
 
     """
 
-    def __init__(self, xyz: np.ndarray = np.empty((1, 3))):
-        self._xyz = xyz
+    def __init__(self, xyz: np.ndarray | None = None):
+        if xyz is None:
+            self._xyz = np.empty((0, 3), dtype=np.float64)
+        else:
+            self._xyz = np.array(xyz, dtype=np.float64, order="C")
+
+        self._x = np.ascontiguousarray(self._xyz[:, 0])
+        self._y = np.ascontiguousarray(self._xyz[:, 1])
+        self._z = np.ascontiguousarray(self._xyz[:, 2])
+
+        for values in (self._xyz, self._x, self._y, self._z):
+            values.flags.writeable = False
 
     @property
     def x(self) -> float:
-        return self._xyz[:, 0]
+        return self._x
 
     @property
     def y(self) -> float:
-        return self._xyz[:, 1]
+        return self._y
 
     @property
     def z(self) -> float:
-        return self._xyz[:, 2]
+        return self._z
 
     @property
     def locations(self) -> np.ndarray:
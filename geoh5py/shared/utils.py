@@ -17,13 +17,35 @@
 
 from __future__ import annotations
 
+import os
+import threading
 from abc import ABC
 from contextlib import contextmanager
+from functools import lru_cache
+from hashlib import blake2b
 
 import h5py
 import numpy as np
 
 
+class _SharedHandle:
+    """
+    Handle to a geoh5 file opened by name, with the number of nested
+    :func:`fetch_h5_handle` calls using it.
+    """
+
+    __slots__ = ("h5file", "count")
+
+    def __init__(self, h5file: h5py.File):
+        self.h5file = h5file
+        self.count = 0
+
+
+# Handles opened by name, shared by nested calls on the same file
+_open_handles: dict[str, _SharedHandle] = {}
+_open_handles_lock = threading.Lock()
+
+
 @contextmanager
 def fetch_h5_handle(
     file: str | h5py.File,
@@ -31,6 +53,8 @@ def fetch_h5_handle(
     """
     Open in read+ mode a geoh5 file from string.
     If receiving a file instead of a string, merely return the given file.
+    Nested calls on the same file name share the handle opened by the
+    outermost call, which closes it on exit.
 
     :param file: Name or handle to a geoh5 file.
 
@@ -42,14 +66,24 @@ def fetch_h5_handle(
         finally:
             pass
     else:
-        h5file = h5py.File(file, "r+")
+        key = os.path.abspath(file)
+        with _open_handles_lock:
+            handle = _open_handles.get(key)
+            if handle is None:
+                handle = _SharedHandle(h5py.File(file, "r+"))
+                _open_handles[key] = handle
+            handle.count += 1
         try:
-            yield h5file
+            yield handle.h5file
         finally:
-            h5file.close()
+            with _open_handles_lock:
+                handle.count -= 1
+                if handle.count == 0:
+                    del _open_handles[key]
+                    handle.h5file.close()
 
 
-def match_values(vec_a, vec_b, collocation_distance=1e-4):
+def match_values(vec_a, vec_b, collocation_distance=1e-4, assume_sorted=False):
     """
     Find indices of matching values between two arrays, within collocation_distance.
 
@@ -59,19 +93,46 @@ def match_values(vec_a, vec_b, collocation_distance=1e-4):
     :param: vec_b, list or numpy.ndarray
         Query values
 
+    :param: assume_sorted=False, bool
+        Skip the sorting of vec_a, which must then be in increasing order.
+
     :return: indices, numpy.ndarray
         Pairs of indices for matching values between the two arrays such
-        that vec_a[ind[:, 0]] == vec_b[ind[:, 1]].
+        that vec_a[ind[:, 0]] == vec_b[ind[:, 1]]. Each query value is paired
+        with its nearest value in vec_a.
     """
-    ind_sort = np.argsort(vec_a)
-    ind = np.minimum(
-        np.searchsorted(vec_a[ind_sort], vec_b, side="right"), vec_a.shape[0] - 1
-    )
-    nearests = np.c_[ind, ind - 1]
-    match = np.where(
-        np.abs(vec_a[ind_sort][nearests] - vec_b[:, None]) < collocation_distance
-    )
-    indices = np.c_[ind_sort[nearests[match[0], match[1]]], match[0]]
+    if assume_sorted:
+        sorted_a = vec_a
+    else:
+        ind_sort = np.argsort(vec_a, kind="stable")
+        sorted_a = vec_a[ind_sort]
+
+    ind = np.searchsorted(sorted_a, vec_b)
+    right = np.minimum(ind, sorted_a.shape[0] - 1)
+
+    if (
+        np.issubdtype(sorted_a.dtype, np.integer)
+        and np.issubdtype(vec_b.dtype, np.integer)
+        and 0 < collocation_distance <= 1
+    ):
+        # Integers closer than a unit are equal: match at the insertion point
+        match = np.nonzero(sorted_a[right] == vec_b)[0]
+        nearest = right[match]
+    else:
+        left = np.maximum(ind - 1, 0)
+        d_left = sorted_a[left] - vec_b
+        d_right = sorted_a[right] - vec_b
+        np.abs(d_left, out=d_left)
+        np.abs(d_right, out=d_right)
+        use_right = d_right <= d_left
+        np.copyto(d_left, d_right, where=use_right)
+        match = np.nonzero(d_left < collocation_distance)[0]
+        nearest = np.where(use_right[match], right[match], left[match])
+
+    if not assume_sorted:
+        nearest = ind_sort[nearest]
+
+    indices = np.column_stack((nearest, match))
     return indices
 
 
@@ -91,29 +152,65 @@ def merge_arrays(
     :param: tail, numpy.array of float
         Second vector of shape(N,) to be appended
     :param: mapping=None, numpy.ndarray of int
-        Optional array where values from the head are replaced by the tail.
+        Optional array where values from the head are replaced by the tail,
+        e.g. from :func:`match_values` with assume_sorted=True on a sorted head.
     :param: collocation_distance=1e-4, float
         Tolerance between matching values.
-
     :return: numpy.array shape(O,)
         Unique values from head to tail without repeats, within collocation_distance.
     """
 
     if mapping is None:
-        mapping = match_values(head, tail, collocation_distance=collocation_distance)
+        mapping = match_values(
+            head,
+            tail,
+            collocation_distance=collocation_distance,
+        )
 
-    if mapping.shape[0] > 0:
+    if mapping.shape[0] == 0:
+        merged = np.concatenate((head, tail))
+    else:
         if replace == "B->A":
             head[mapping[:, 0]] = tail[mapping[:, 1]]
         else:
             tail[mapping[:, 1]] = head[mapping[:, 0]]
 
-        tail = np.delete(tail, mapping[:, 1])
+        keep = np.ones(tail.shape[0], dtype=bool)
+        keep[mapping[:, 1]] = False
+
+        merged = np.empty(
+            head.shape[0] + int(keep.sum()), dtype=np.result_type(head, tail)
+        )
+        merged[: head.shape[0]] = head
+        np.compress(
+            keep, tail.astype(merged.dtype, copy=False), out=merged[head.shape[0] :]
+        )
 
     if return_mapping:
-        return np.r_[head, tail], mapping
+        return merged, mapping
+
+    return merged
+
 
-    return np.r_[head, tail]
+@lru_cache(maxsize=None)
+def _public_attributes(entity_type: type, names: tuple) -> tuple:
+    """
+    Public names of the private attributes exposed by accessors on a class.
+
+    :param entity_type: Class of the entity.
+    :param names: Private attribute names, as found in the instance ``__dict__``.
+
+    :return: Public attribute names, in order.
+    """
+    return tuple(name[1:] for name in names if hasattr(entity_type, name[1:]))
+
+
+@lru_cache(maxsize=None)
+def _is_entity_type(value_type: type) -> bool:
+    """
+    Whether values of a given type are compared recursively.
+    """
+    return issubclass(value_type, ABC)
 
 
 def compare_entities(object_a, object_b, ignore: list | None = None, decimal: int = 6):
@@ -123,21 +220,117 @@ def compare_entities(object_a, object_b, ignore: list | None = None, decimal: in
         for item in ignore:
             ignore_list.append(item)
 
-    for attr in object_a.__dict__.keys():
-        if attr in ignore_list:
-            continue
-        if isinstance(getattr(object_a, attr[1:]), ABC):
-            compare_entities(
-                getattr(object_a, attr[1:]), getattr(object_b, attr[1:]), ignore=ignore
-            )
-        else:
-            if isinstance(getattr(object_a, attr[1:]), np.ndarray):
+    ignore_set = frozenset(ignore_list)
+    attributes = _public_attributes(
+        type(object_a),
+        tuple(attr for attr in object_a.__dict__ if attr not in ignore_set),
+    )
+
+    tolerance = 10 ** -decimal
+    for attr in attributes:
+        value_a = getattr(object_a, attr)
+        value_b = getattr(object_b, attr)
+
+        if isinstance(value_a, np.ndarray):
+            if (
+                isinstance(value_b, np.ndarray)
+                and value_a.dtype == value_b.dtype
+                and np.array_equal(value_a, value_b)
+            ):
+                continue
+
+            if value_a.dtype.names is not None:
+                # Structured arrays do not promote in allclose
                 np.testing.assert_array_almost_equal(
-                    getattr(object_a, attr[1:]).tolist(),
-                    getattr(object_b, attr[1:]).tolist(),
+                    value_a.tolist(),
+                    np.asarray(value_b).tolist(),
                     decimal=decimal,
+                    err_msg=f"Output attribute '{attr}' for {object_a} do not "
+                    f"match input {object_b}",
                 )
-            else:
-                assert np.all(
-                    getattr(object_a, attr[1:]) == getattr(object_b, attr[1:])
-                ), f"Output attribute '{attr[1:]}' for {object_a} do not match input {object_b}"
+                continue
+
+            assert np.shape(value_a) == np.shape(value_b) and np.allclose(
+                value_a, value_b, rtol=0, atol=tolerance, equal_nan=True
+            ), f"Output attribute '{attr}' for {object_a} do not match input {object_b}"
+        elif _is_entity_type(type(value_a)):
+            compare_entities(value_a, value_b, ignore=ignore, decimal=decimal)
+        else:
+            equal = value_a == value_b
+            if isinstance(equal, np.ndarray):
+                equal = np.all(equal)
+
+            assert (
+                equal
+            ), f"Output attribute '{attr}' for {object_a} do not match input {object_b}"
+
+
+def entity_digest(entity, ignore: list | None = None, decimal: int = 6) -> dict:
+    """
+    Digest of the attributes of an entity, for comparison by equality.
+
+    :param entity: Object to digest.
+    :param ignore: List of private attribute names to skip, in addition to
+        ``_workspace`` and ``_children``.
+    :param decimal: Number of decimals kept on floating point values.
+
+    :return digest: Dictionary of attribute names and their digest, as given
+        by :func:`value_digest`.
+    """
+    ignore_set = frozenset(["_workspace", "_children"] + (ignore or []))
+    digest: dict = {}
+    for attr in entity.__dict__:
+        if attr in ignore_set or not hasattr(type(entity), attr[1:]):
+            continue
+
+        digest[attr[1:]] = value_digest(
+            getattr(entity, attr[1:]), ignore=ignore, decimal=decimal
+        )
+
+    return digest
+
+
+def value_digest(value, ignore: list | None = None, decimal: int = 6):
+    """
+    Digest of a value, for comparison by equality.
+
+    :param value: Value to digest.
+    :param ignore: List of private attribute names skipped on nested entities.
+    :param decimal: Number of decimals kept on floating point values.
+
+    :return digest: Numeric arrays are hashed from their bytes, floats rounded
+        to decimal. Entities, containers and objects without a custom
+        ``repr`` are digested recursively, and other values are represented
+        by their ``repr``.
+    """
+    if isinstance(value, ABC):
+        digest = entity_digest(value, ignore=ignore, decimal=decimal)
+    elif isinstance(value, np.ndarray) and value.dtype.hasobject:
+        digest = value.shape, [
+            value_digest(val, ignore, decimal) for val in value.ravel()
+        ]
+    elif isinstance(value, np.ndarray):
+        if np.issubdtype(value.dtype, np.floating):
+            # Adding zero folds negative zeros after rounding
+            value = np.round(value, decimal) + 0.0
+
+        array = np.ascontiguousarray(value)
+        hasher = blake2b(str((array.dtype.str, array.shape)).encode())
+        hasher.update(array.tobytes())
+        digest = hasher.hexdigest()
+    elif isinstance(value, (list, tuple)):
+        digest = type(value).__name__, [
+            value_digest(val, ignore, decimal) for val in value
+        ]
+    elif isinstance(value, dict):
+        digest = {
+            repr(key): value_digest(val, ignore, decimal) for key, val in value.items()
+        }
+    elif isinstance(value, (float, np.floating)):
+        digest = repr(round(float(value), decimal) + 0.0)
+    elif type(value).__repr__ is object.__repr__ and hasattr(value, "__dict__"):
+        digest = type(value).__name__, value_digest(vars(value), ignore, decimal)
+    else:
+        digest = repr(value)
+
+    return digest
@@ -52,6 +52,9 @@ class Workspace:
 
     :param h5file: File name of the target *geoh5* file.
         A new project is created if the target file cannot by found on disk.
+    :param driver: Optional h5py file driver, e.g. "core" for a file held in memory,
+        kept open and locked until the workspace is closed.
+    :param backing_store: Write the file to disk on close, "core" driver only.
     """
 
     _active_ref: ClassVar[ReferenceType[Workspace]] = type(None)  # type: ignore
@@ -63,7 +66,13 @@ class Workspace:
         "Version": "version",
     }
 
-    def __init__(self, h5file: str = "Analyst.geoh5", **kwargs):
+    def __init__(
+        self,
+        h5file: str = "Analyst.geoh5",
+        driver: str | None = None,
+        backing_store: bool = False,
+        **kwargs,
+    ):
 
         self._contributors = np.asarray(
             ["UserName"], dtype=h5py.special_dtype(vlen=str)
@@ -78,6 +87,7 @@ class Workspace:
         self._objects: dict[uuid.UUID, ReferenceType[object_base.ObjectBase]] = {}
         self._data: dict[uuid.UUID, ReferenceType[data.Data]] = {}
         self._h5file = h5file
+        self._h5_handle: h5py.File | None = None
 
         for attr, item in kwargs.items():
             try:
@@ -87,7 +97,14 @@ class Workspace:
             except AttributeError:
                 continue
 
-        with h5py.File(self.h5file, "a") as file:
+        if backing_store and driver != "core":
+            raise ValueError("Option 'backing_store' requires the 'core' driver.")
+        options = {"backing_store": backing_store} if driver == "core" else {}
+        file = h5py.File(self.h5file, "a", driver=driver, **options)
+        if driver is not None:
+            self._h5_handle = file
+
+        try:
             try:
                 proj_attributes = self._io_call(file, H5Reader.fetch_project_attributes)
 
@@ -98,6 +115,15 @@ class Workspace:
                 self._io_call(file, H5Writer.create_geoh5, self)
 
             self.fetch_or_create_root(file)
+        finally:
+            if self._h5_handle is None:
+                file.close()
+
+    def __enter__(self) -> Workspace:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def activate(self):
         """Makes this workspace the active one.
@@ -155,6 +181,12 @@ class Workspace:
     def contributors(self, value: list[str]):
         self._contributors = np.asarray(value, dtype=h5py.special_dtype(vlen=str))
 
+    def close(self):
+        """Close the file held open by a file driver."""
+        if self._h5_handle is not None:
+            self._h5_handle.close()
+            self._h5_handle = None
+
     def copy_to_parent(
         self, entity, parent, copy_children: bool = True, omit_list: tuple = ()
     ):
@@ -171,11 +203,12 @@ class Workspace:
 
         entity_kwargs: dict = {"entity": {"uid": None, "parent": None}}
         for key in entity.__dict__.keys():
-            if key not in ["_uid", "_entity_type"] + list(omit_list):
-                if key[0] == "_":
-                    key = key[1:]
-
-                entity_kwargs["entity"][key] = getattr(entity, key)
+            name = key[1:] if key[0] == "_" else key
+            # Skip private (cached) attributes without a public accessor
+            if key not in ["_uid", "_entity_type"] + list(omit_list) and hasattr(
+                type(entity), name
+            ):
+                entity_kwargs["entity"][name] = getattr(entity, name)
 
         entity_type_kwargs: dict = {"entity_type": {}}
         for key in entity.entity_type.__dict__.keys():
@@ -662,19 +695,20 @@ class Workspace:
 
         :param file: :obj:`h5py.File` or name of the target geoh5 file
         """
-        for entity in (
-            cast(List["Entity"], self.objects)
-            + cast(List["Entity"], self.groups)
-            + cast(List["Entity"], self.data)
-        ):
-            if len(entity.modified_attributes) > 0:
-                self.save_entity(entity, file=file)
+        with fetch_h5_handle(self.validate_file(file)) as h5file:
+            for entity in (
+                cast(List["Entity"], self.objects)
+                + cast(List["Entity"], self.groups)
+                + cast(List["Entity"], self.data)
+            ):
+                if len(entity.modified_attributes) > 0:
+                    self.save_entity(entity, file=h5file)
 
-        for entity_type in self.types:
-            if len(entity_type.modified_attributes) > 0:
-                self._io_call(file, H5Writer.write_entity_type, entity_type)
+            for entity_type in self.types:
+                if len(entity_type.modified_attributes) > 0:
+                    self._io_call(h5file, H5Writer.write_entity_type, entity_type)
 
-        self._io_call(file, H5Writer.finalize, self)
+            self._io_call(h5file, H5Writer.finalize, self)
 
     def find_data(self, data_uid: uuid.UUID) -> Entity | None:
         """
@@ -732,19 +766,34 @@ class Workspace:
 
         :return: List of entities with the same given name.
         """
-        if isinstance(name, uuid.UUID):
-            list_entity_uid = [name]
+        return self.get_entities([name])[name]
+
+    def get_entities(
+        self, names: list[str | uuid.UUID]
+    ) -> dict[str | uuid.UUID, list[Entity | None]]:
+        """
+        Retrieve several entities from their identifiers, either by name or
+        :obj:`uuid.UUID`, with a single pass over the registered entities.
+
+        :param names: List of object identifiers, either names or uuids.
+
+        :return: Dictionary of identifiers and lists of matching entities.
+        """
+        uids_by_name: dict[str, list[uuid.UUID]] = {}
+        if any(not isinstance(name, uuid.UUID) for name in names):
+            for uid, entity_name in self.list_entities_name.items():
+                uids_by_name.setdefault(entity_name, []).append(uid)
 
-        else:  # Extract all objects uuid with matching name
-            list_entity_uid = [
-                key for key, val in self.list_entities_name.items() if val == name
-            ]
+        entities: dict[str | uuid.UUID, list[Entity | None]] = {}
+        for name in names:
+            if isinstance(name, uuid.UUID):
+                list_entity_uid = [name]
+            else:  # Extract all objects uuid with matching name
+                list_entity_uid = uids_by_name.get(name, [])
 
-        entity_list: list[Entity | None] = []
-        for uid in list_entity_uid:
-            entity_list.append(self.find_entity(uid))
+            entities[name] = [self.find_entity(uid) for uid in list_entity_uid]
 
-        return entity_list
+        return entities
 
     @property
     def groups(self) -> list[groups.Group]:
@@ -903,10 +952,10 @@ class Workspace:
 
     def validate_file(self, file) -> h5py.File:
         """
-        Validate the h5file name
+        Validate the h5file name, or the handle held open by a file driver.
         """
         if file is None:
-            file = self.h5file
+            file = self.h5file if self._h5_handle is None else self._h5_handle
 
         return file
 
@@ -82,8 +82,9 @@ def test_copy_entity():
         for entity in workspace.objects:
 
             # Read the data back in from a fresh workspace
-            rec_entity = new_workspace.get_entity(entity.uid)[0]
-            rec_data = new_workspace.get_entity(entity.children[0].uid)[0]
+            entities = new_workspace.get_entities([entity.uid, entity.children[0].uid])
+            rec_entity = entities[entity.uid][0]
+            rec_data = entities[entity.children[0].uid][0]
 
             compare_entities(entity, rec_entity, ignore=["_parent"])
             compare_entities(entity.children[0], rec_data, ignore=["_parent"])
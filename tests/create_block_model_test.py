@@ -19,12 +19,71 @@ import tempfile
 from pathlib import Path
 
 import numpy as np
+import pytest
 
 from geoh5py.objects import BlockModel
 from geoh5py.shared.utils import compare_entities
 from geoh5py.workspace import Workspace
 
 
+def cell_centers_1d(delimiters):
+    """
+    Cell centers along one axis of a block model.
+
+    :param delimiters: Cell delimiters along the axis.
+
+    :return: Array of cell centers, shape(len(delimiters) - 1,).
+    """
+    return (delimiters[:-1] + delimiters[1:]) / 2.0
+
+
+def cell_delimiters(n_core, n_pad_left, n_pad_right):
+    """
+    Cell delimiters with uniform core cells and geometrically expanding padding.
+
+    :param n_core: Number of core cells of width pi / n_core.
+    :param n_pad_left: Number of padding cells before the core.
+    :param n_pad_right: Number of padding cells after the core.
+
+    :return: Array of delimiters starting at 0,
+        shape(n_pad_left + n_core + n_pad_right + 1,).
+    """
+    width = np.pi / n_core
+    delimiters = np.empty(n_pad_left + n_core + n_pad_right + 1)
+    delimiters[0] = 0
+    widths = delimiters[1:]
+    widths[:n_pad_left] = width * 1.5 ** np.arange(n_pad_left)[::-1]
+    widths[n_pad_left : n_pad_left + n_core] = width
+    widths[n_pad_left + n_core :] = width * 1.5 ** np.arange(n_pad_right)
+    np.cumsum(widths, out=widths)
+
+    return delimiters
+
+
+def separable_cosines(u_delimiters, v_delimiters, z_delimiters):
+    """
+    Product of the cosines of the cell centers along each axis, computed on the
+    unique centers and broadcast over the grid.
+
+    :param u_delimiters: Cell delimiters along the u-axis.
+    :param v_delimiters: Cell delimiters along the v-axis.
+    :param z_delimiters: Cell delimiters along the z-axis.
+
+    :return: Array of values in the (v, u, z) order of the centroids.
+    """
+    cos_u = cell_centers_1d(u_delimiters)
+    cos_v = cell_centers_1d(v_delimiters)
+    cos_z = cell_centers_1d(z_delimiters)
+    for centers in (cos_u, cos_v, cos_z):
+        np.cos(centers, out=centers)
+
+    values = np.empty((cos_v.shape[0], cos_u.shape[0], cos_z.shape[0]))
+    np.multiply(cos_v[:, None, None], cos_u[None, :, None], out=values)
+    values *= cos_z[None, None, :]
+
+    return values.ravel()
+
+
 def test_create_block_model_data():
 
     name = "MyTestBlockModel"
@@ -32,36 +91,9 @@ def test_create_block_model_data():
     # Generate a 3D array
     n_x, n_y, n_z = 8, 9, 10
 
-    nodal_x = np.r_[
-        0,
-        np.cumsum(
-            np.r_[
-                np.pi / n_x * 1.5 ** np.arange(3)[::-1],
-                np.ones(n_x) * np.pi / n_x,
-                np.pi / n_x * 1.5 ** np.arange(4),
-            ]
-        ),
-    ]
-    nodal_y = np.r_[
-        0,
-        np.cumsum(
-            np.r_[
-                np.pi / n_y * 1.5 ** np.arange(5)[::-1],
-                np.ones(n_y) * np.pi / n_y,
-                np.pi / n_y * 1.5 ** np.arange(6),
-            ]
-        ),
-    ]
-    nodal_z = -np.r_[
-        0,
-        np.cumsum(
-            np.r_[
-                np.pi / n_z * 1.5 ** np.arange(7)[::-1],
-                np.ones(n_z) * np.pi / n_z,
-                np.pi / n_z * 1.5 ** np.arange(8),
-            ]
-        ),
-    ]
+    nodal_x = cell_delimiters(n_x, 3, 4)
+    nodal_y = cell_delimiters(n_y, 5, 6)
+    nodal_z = -cell_delimiters(n_z, 7, 8)
 
     with tempfile.TemporaryDirectory() as tempdir:
         h5file_path = Path(tempdir) / r"block_model.geoh5"
@@ -84,11 +116,7 @@ def test_create_block_model_data():
             {
                 "DataValues": {
                     "association": "CELL",
-                    "values": (
-                        np.cos(grid.centroids[:, 0])
-                        * np.cos(grid.centroids[:, 1])
-                        * np.cos(grid.centroids[:, 2])
-                    ),
+                    "values": separable_cosines(nodal_x, nodal_y, nodal_z),
                 }
             }
         )
@@ -96,8 +124,30 @@ def test_create_block_model_data():
         # Read the data back in from a fresh workspace
         new_workspace = Workspace(h5file_path)
 
-        rec_obj = new_workspace.get_entity(name)[0]
-        rec_data = new_workspace.get_entity("DataValues")[0]
+        rec_obj, rec_data = (
+            entities[0]
+            for entities in new_workspace.get_entities([name, "DataValues"]).values()
+        )
 
         compare_entities(grid, rec_obj)
         compare_entities(data, rec_data)
+
+
+def test_compare_block_model_origin():
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        workspace = Workspace(Path(tempdir) / r"block_model_origin.geoh5")
+        grids = [
+            BlockModel.create(
+                workspace,
+                origin=origin,
+                u_cell_delimiters=cell_delimiters(2, 1, 1),
+                v_cell_delimiters=cell_delimiters(2, 1, 1),
+                z_cell_delimiters=-cell_delimiters(2, 1, 1),
+            )
+            for origin in ([0, 0, 0], [0, 0, 1])
+        ]
+
+        # Structured origins that differ fail with an assertion
+        with pytest.raises(AssertionError):
+            compare_entities(grids[0], grids[1], ignore=["_uid", "_parent"])
@@ -21,6 +21,7 @@ import tempfile
 from pathlib import Path
 
 import numpy as np
+import pytest
 
 from geoh5py.objects import Drillhole
 from geoh5py.shared.utils import compare_entities
@@ -197,3 +198,37 @@ def test_outside_survey():
         )
 
         np.testing.assert_array_almost_equal(locations, solution, decimal=3)
+
+
+def test_collar_reassignment():
+    collar = np.r_[0.0, 10.0, 10.0]
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        h5file_path = Path(tempdir) / r"testCurve.geoh5"
+        workspace = Workspace(h5file_path)
+        well = Drillhole.create(
+            workspace, collar=collar, surveys=np.c_[[0.0, 100.0], [-90, -80], [0, 0]]
+        )
+        locations = well.locations
+
+        well.collar = collar.tolist()
+        assert well.locations is locations, "Same collar should keep the locations."
+
+        well.collar = collar + 1.0
+        np.testing.assert_array_almost_equal(well.locations, locations + 1.0)
+
+
+def test_surveys_read_only():
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        h5file_path = Path(tempdir) / r"testCurve.geoh5"
+        workspace = Workspace(h5file_path)
+        well = Drillhole.create(
+            workspace,
+            collar=np.r_[0.0, 10.0, 10.0],
+            surveys=np.c_[[0.0, 100.0], [-90, -80], [0, 0]],
+        )
+
+        # The cached surveys must not be modified in place
+        with pytest.raises(ValueError):
+            well.surveys[:, 0] *= 2
@@ -27,17 +27,17 @@ def test_create_point_data():
 
     with tempfile.TemporaryDirectory() as tempdir:
         h5file_path = Path(tempdir) / r"test.geoh5"
-        workspace = Workspace(h5file_path)
-        group = ContainerGroup.create(workspace, parent=None)
-        assert (
-            group.parent == workspace.root
-        ), "Assigned parent=None should default to Root."
+        with Workspace(h5file_path, driver="core") as workspace:
+            group = ContainerGroup.create(workspace, parent=None)
+            assert (
+                group.parent == workspace.root
+            ), "Assigned parent=None should default to Root."
 
-        group = ContainerGroup.create(workspace)
-        assert (
-            group.parent == workspace.root
-        ), "Creation without parent should default to Root."
+            group = ContainerGroup.create(workspace)
+            assert (
+                group.parent == workspace.root
+            ), "Creation without parent should default to Root."
 
-        points = Points.create(workspace, parent=group)
+            points = Points.create(workspace, parent=group)
 
-        assert points.parent == group, "Parent setter did not work."
+            assert points.parent == group, "Parent setter did not work."
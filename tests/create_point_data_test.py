@@ -62,9 +62,12 @@ def test_create_point_data():
         # Read the data back in from a fresh workspace
         new_workspace = Workspace(h5file_path)
 
-        rec_obj = new_workspace.get_entity(name)[0]
-        rec_data = new_workspace.get_entity(new_name)[0]
-        rec_tag = new_workspace.get_entity("my_comment")[0]
+        rec_obj, rec_data, rec_tag = (
+            entities[0]
+            for entities in new_workspace.get_entities(
+                [name, new_name, "my_comment"]
+            ).values()
+        )
 
         compare_entities(points, rec_obj)
         compare_entities(data, rec_data)
@@ -0,0 +1,60 @@
+#  Copyright (c) 2021 Mira Geoscience Ltd.
+#
+#  This file is part of geoh5py.
+#
+#  geoh5py is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  geoh5py is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with geoh5py.  If not, see <https://www.gnu.org/licenses/>.
+
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from geoh5py.objects import Points
+from geoh5py.shared.utils import entity_digest, value_digest
+from geoh5py.workspace import Workspace
+
+
+def test_entity_digest():
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        workspace = Workspace(Path(tempdir) / r"digest.geoh5")
+        # Multiples of 1/8 sit well away from the rounding edges
+        xyz = np.arange(36).reshape(12, 3) / 8.0
+        points = Points.create(workspace, vertices=xyz)
+
+        # Differences below the decimal and signed zeros digest equal
+        other = Points.create(workspace, vertices=xyz + 1e-9)
+        other.vertices[0, :] = -0.0
+        points.vertices[0, :] = 0.0
+        ignore = ["_uid", "_parent"]
+        assert entity_digest(points, ignore=ignore) == entity_digest(
+            other, ignore=ignore
+        ), "Rounded vertices should digest equal"
+
+        other.vertices[1, 0] += 1e-3
+        assert entity_digest(points, ignore=ignore) != entity_digest(
+            other, ignore=ignore
+        ), "Mismatch in vertices not detected"
+
+
+def test_value_digest():
+    values = np.zeros(2000)
+    modified = values.copy()
+    modified[1000] = 1.0
+
+    # Arrays nested in containers are hashed in full, not from a truncated repr
+    assert value_digest([values]) != value_digest([modified])
+    assert value_digest({"values": values}) != value_digest({"values": modified})
+    assert value_digest([values]) != value_digest((values,))
+    assert value_digest(-0.0) == value_digest(1e-9)
@@ -0,0 +1,40 @@
+#  Copyright (c) 2021 Mira Geoscience Ltd.
+#
+#  This file is part of geoh5py.
+#
+#  geoh5py is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  geoh5py is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with geoh5py.  If not, see <https://www.gnu.org/licenses/>.
+
+import tempfile
+from pathlib import Path
+
+from geoh5py.shared.utils import fetch_h5_handle
+from geoh5py.workspace import Workspace
+
+
+def test_nested_fetch_h5_handle():
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        h5file_path = Path(tempdir) / r"handle.geoh5"
+        Workspace(h5file_path)
+
+        with fetch_h5_handle(h5file_path) as h5file:
+            with fetch_h5_handle(str(h5file_path)) as nested:
+                assert nested is h5file, "Nested call should share the open handle"
+
+            assert h5file, "Handle closed by a nested call"
+
+        assert not h5file, "Handle left open after the outermost call"
+
+        with fetch_h5_handle(h5file_path) as h5file_b:
+            assert h5file_b is not h5file, "Closed handle should not be reused"
@@ -0,0 +1,74 @@
+#  Copyright (c) 2021 Mira Geoscience Ltd.
+#
+#  This file is part of geoh5py.
+#
+#  geoh5py is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  geoh5py is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with geoh5py.  If not, see <https://www.gnu.org/licenses/>.
+
+import numpy as np
+
+from geoh5py.shared.utils import match_values, merge_arrays
+
+
+def test_match_values():
+    vec_a = np.r_[5.0, 1.0, 3.0, 1.05]
+    vec_b = np.r_[0.99, 3.0, 10.0, 1.04, 5.00001]
+
+    indices = match_values(vec_a, vec_b, collocation_distance=0.1)
+
+    # Only the nearest value is matched
+    np.testing.assert_array_equal(indices, [[1, 0], [2, 1], [3, 3], [0, 4]])
+
+    # Queries below the smallest value
+    indices = match_values(np.r_[1.0, 1.05], np.r_[0.99], collocation_distance=0.1)
+
+    np.testing.assert_array_equal(indices, [[0, 0]])
+
+    # Pre-sorted input
+    vec_a = np.sort(vec_a)
+    indices = match_values(vec_a, vec_b, collocation_distance=0.1, assume_sorted=True)
+
+    np.testing.assert_array_equal(indices, [[0, 0], [2, 1], [1, 3], [3, 4]])
+
+
+def test_match_integer_values():
+    vec_a = np.r_[7, 2, 5, 2]
+    vec_b = np.r_[5, 3, 2, 2, 9]
+
+    indices = match_values(vec_a, vec_b, collocation_distance=1)
+
+    np.testing.assert_array_equal(indices, [[2, 0], [1, 2], [1, 3]])
+
+    # No tolerance matches nothing, as for floats
+    indices = match_values(np.r_[1, 2, 3], np.r_[2, 3], collocation_distance=0)
+
+    assert indices.shape[0] == 0, "Integer values matched without tolerance"
+
+
+def test_merge_arrays():
+    head = np.r_[0.0, 1.0, 2.0]
+    tail = np.r_[1.00001, 3.0]
+
+    merged, mapping = merge_arrays(
+        head, tail, collocation_distance=1e-4, return_mapping=True
+    )
+
+    np.testing.assert_array_equal(merged, [0.0, 1.0, 2.0, 3.0])
+    np.testing.assert_array_equal(mapping, [[1, 0]])
+
+    # Mapping precomputed on a sorted head
+    merged = merge_arrays(
+        head, tail, mapping=match_values(head, tail, assume_sorted=True)
+    )
+
+    np.testing.assert_array_equal(merged, [0.0, 1.0, 2.0, 3.0])
@@ -0,0 +1,50 @@
+#  Copyright (c) 2021 Mira Geoscience Ltd.
+#
+#  This file is part of geoh5py.
+#
+#  geoh5py is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  geoh5py is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with geoh5py.  If not, see <https://www.gnu.org/licenses/>.
+
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from geoh5py.objects import Points
+from geoh5py.shared.utils import compare_entities
+from geoh5py.workspace import Workspace
+
+
+def test_core_driver_workspace():
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        h5file_path = Path(tempdir) / r"in_memory.geoh5"
+
+        with Workspace(h5file_path, driver="core") as workspace:
+            Points.create(workspace, vertices=np.random.randn(12, 3), name="points")
+            workspace.finalize()
+
+        assert not h5file_path.exists(), "In-memory workspace written to disk"
+
+        # Write the in-memory file to disk on close, then re-open by name
+        workspace = Workspace(h5file_path, driver="core", backing_store=True)
+        points = Points.create(workspace, vertices=np.random.randn(12, 3))
+        workspace.finalize()
+        workspace.close()
+
+        new_workspace = Workspace(h5file_path)
+        compare_entities(points, new_workspace.get_entity(points.uid)[0])
+
+        with pytest.raises(ValueError):
+            Workspace(h5file_path, backing_store=True)